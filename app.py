@@ -1,10 +1,15 @@
 from flask import Flask, render_template, request, jsonify
-from models import CourtCase, db
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from models import CourtCase, db, create_search_index, search_cases_fulltext
 from scraper.delhi_high_court import DelhiHighCourtScraper
 from utils import format_date, validate_case_number
 import os
 import logging
 from datetime import datetime
+from threading import Lock
+
+from cachetools import TTLCache
 
 # Configure logging
 logging.basicConfig(
@@ -14,11 +19,31 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///cases.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+@event.listens_for(Engine, 'connect')
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune each new SQLite connection for concurrent reads and caching"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA cache_size=-65536')
+    cursor.execute('PRAGMA mmap_size=268435456')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.close()
+
 db.init_app(app)
 
+# One scraper for the whole process so its underlying HTTP session and
+# connection pool are reused across requests (Session is thread-safe)
+SCRAPER = DelhiHighCourtScraper()
+
+# Short-lived scraper result cache so burst repeats of the same search
+# (page refreshes, bots) don't re-hit the court website
+_SCRAPE_CACHE = TTLCache(maxsize=512, ttl=600)
+_SCRAPE_CACHE_LOCK = Lock()
+
 @app.route('/')
 def index():
     """Main page for the court data fetcher"""
@@ -39,32 +64,32 @@ def search_cases():
         if case_number and not validate_case_number(case_number):
             return jsonify({'error': 'Invalid case number format'}), 400
         
-        # Search in database first
-        query = CourtCase.query
-        
-        if case_number:
-            query = query.filter(CourtCase.case_number.ilike(f'%{case_number}%'))
-        if party_name:
-            query = query.filter(
-                (CourtCase.petitioner.ilike(f'%{party_name}%')) |
-                (CourtCase.respondent.ilike(f'%{party_name}%'))
-            )
-        
-        existing_cases = query.limit(10).all()
+        # Search in database first, via the FTS5 index
+        search_terms = ' '.join(filter(None, [case_number, party_name]))
+        existing_cases = search_cases_fulltext(search_terms, limit=10)
         
         # If no results in database, try scraping
         if not existing_cases:
-            scraper = DelhiHighCourtScraper()
-            scraped_cases = scraper.search_cases(case_number, party_name)
-            
+            cache_key = (case_number, party_name)
+            with _SCRAPE_CACHE_LOCK:
+                cached_cases = _SCRAPE_CACHE.get(cache_key)
+
+            if cached_cases is not None:
+                if cached_cases:
+                    return jsonify({'cases': cached_cases})
+                return jsonify({'cases': [], 'message': 'No cases found'})
+
+            scraped_cases = SCRAPER.search_cases(case_number, party_name)
+
+            with _SCRAPE_CACHE_LOCK:
+                _SCRAPE_CACHE[cache_key] = scraped_cases
+
             if scraped_cases:
-                # Save scraped cases to database
+                # Save scraped cases to database in a single executemany
                 try:
-                    for case_data in scraped_cases:
-                        case = CourtCase(**case_data)
-                        db.session.add(case)
+                    db.session.bulk_insert_mappings(CourtCase, scraped_cases)
                     db.session.commit()
-                    
+
                     return jsonify({'cases': scraped_cases})
                 except Exception as e:
                     db.session.rollback()
@@ -141,8 +166,7 @@ def health_check():
 def test_scraper():
     """Test the scraper connection to Delhi High Court"""
     try:
-        scraper = DelhiHighCourtScraper()
-        test_result = scraper.test_connection()
+        test_result = SCRAPER.test_connection()
         
         return jsonify({
             'scraper_test': test_result,
@@ -159,4 +183,5 @@ def test_scraper():
 if __name__ == '__main__':
     with app.app_context():
         db.create_all()
+        create_search_index()
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -1,23 +1,68 @@
-import requests
-from bs4 import BeautifulSoup
-
-def fetch_case_data(case_type, case_number, filing_year):
-    url = "https://delhihighcourt.nic.in/some-search-url"  # placeholder
-    payload = {
-        "case_type": case_type,
-        "case_no": case_number,
-        "year": filing_year,
-    }
-
-    # Replace this with Selenium or Playwright if CAPTCHA present
-    response = requests.post(url, data=payload)
-    soup = BeautifulSoup(response.text, 'html.parser')
-
-    # Dummy values for now
-    data = {
-        "parties": "Party A vs Party B",
-        "filing_date": "2023-04-15",
-        "next_hearing": "2025-09-01",
-        "order_link": "https://somecourt.gov.in/latest_order.pdf"
-    }
-    return data, response.text
+import asyncio
+
+import aiohttp
+from bs4 import BeautifulSoup
+
+# Connection pool and retry tuning: all requests go to the same host, so a
+# keep-alive pool avoids repeating the TLS handshake for every lookup
+_POOL_LIMIT = 20
+_POOL_LIMIT_PER_HOST = 10
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.3
+
+def make_session():
+    """Create a client session with a keep-alive connection pool"""
+    connector = aiohttp.TCPConnector(limit=_POOL_LIMIT, limit_per_host=_POOL_LIMIT_PER_HOST)
+    return aiohttp.ClientSession(connector=connector)
+
+async def _post_with_retries(session, url, payload, timeout):
+    """POST with retries and exponential backoff on connection errors"""
+    for attempt in range(_RETRY_TOTAL):
+        try:
+            async with session.post(url, data=payload, timeout=timeout) as response:
+                return await response.text()
+        except aiohttp.ClientError:
+            if attempt == _RETRY_TOTAL - 1:
+                raise
+            await asyncio.sleep(_RETRY_BACKOFF * (2 ** attempt))
+
+async def fetch_case_data(case_type, case_number, filing_year, session=None):
+    url = "https://delhihighcourt.nic.in/some-search-url"  # placeholder
+    payload = {
+        "case_type": case_type,
+        "case_no": case_number,
+        "year": filing_year,
+    }
+    timeout = aiohttp.ClientTimeout(total=30)
+
+    # Replace this with Selenium or Playwright if CAPTCHA present
+    if session is None:
+        async with make_session() as session:
+            html = await _post_with_retries(session, url, payload, timeout)
+    else:
+        html = await _post_with_retries(session, url, payload, timeout)
+
+    # Parse in a worker thread so the event loop stays free for other fetches
+    soup = await asyncio.to_thread(BeautifulSoup, html, 'lxml')
+
+    # Dummy values for now
+    data = {
+        "parties": "Party A vs Party B",
+        "filing_date": "2023-04-15",
+        "next_hearing": "2025-09-01",
+        "order_link": "https://somecourt.gov.in/latest_order.pdf"
+    }
+    return data, html
+
+def fetch_case_data_sync(case_type, case_number, filing_year):
+    """Synchronous wrapper so Flask routes can call the async scraper unchanged"""
+    return asyncio.run(fetch_case_data(case_type, case_number, filing_year))
+
+async def fetch_many_case_data(case_requests):
+    """Fetch several cases concurrently over one shared connection pool;
+    case_requests is a list of (case_type, case_number, filing_year) tuples"""
+    async with make_session() as session:
+        return await asyncio.gather(
+            *[fetch_case_data(case_type, case_number, filing_year, session=session)
+              for case_type, case_number, filing_year in case_requests]
+        )
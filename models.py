@@ -1,6 +1,4 @@
 from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime
-import uuid
 
 db = SQLAlchemy()
 
@@ -10,18 +8,20 @@ class CourtCase(db.Model):
     """
     __tablename__ = 'court_cases'
     
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    case_number = db.Column(db.String(100), nullable=False, index=True)
-    petitioner = db.Column(db.String(500), nullable=True)
-    respondent = db.Column(db.String(500), nullable=True)
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    # NOCASE collation gives case-insensitive matching with plain LIKE,
+    # so queries stay index-friendly without wrapping columns in LOWER()
+    case_number = db.Column(db.String(100, collation='NOCASE'), nullable=False, index=True)
+    petitioner = db.Column(db.String(500, collation='NOCASE'), nullable=True)
+    respondent = db.Column(db.String(500, collation='NOCASE'), nullable=True)
     filing_date = db.Column(db.Date, nullable=True)
     status = db.Column(db.String(100), nullable=True)
     court = db.Column(db.String(100), nullable=False, default='Delhi High Court')
     case_type = db.Column(db.String(50), nullable=True)
     judge = db.Column(db.String(200), nullable=True)
     next_hearing = db.Column(db.Date, nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=db.func.now())
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
     
     def __repr__(self):
         return f'<CourtCase {self.case_number}>'
@@ -49,13 +49,13 @@ class SearchLog(db.Model):
     """
     __tablename__ = 'search_logs'
     
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     search_type = db.Column(db.String(20), nullable=False)  # 'case_number' or 'party_name'
     search_query = db.Column(db.String(500), nullable=False)
     results_count = db.Column(db.Integer, default=0)
     ip_address = db.Column(db.String(45), nullable=True)
     user_agent = db.Column(db.String(500), nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=db.func.now())
     
     def __repr__(self):
         return f'<SearchLog {self.search_type}: {self.search_query}>'
@@ -66,13 +66,13 @@ class CaseUpdate(db.Model):
     """
     __tablename__ = 'case_updates'
     
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    case_id = db.Column(db.String(36), db.ForeignKey('court_cases.id'), nullable=False)
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    case_id = db.Column(db.Integer, db.ForeignKey('court_cases.id'), nullable=False)
     field_name = db.Column(db.String(50), nullable=False)
     old_value = db.Column(db.Text, nullable=True)
     new_value = db.Column(db.Text, nullable=True)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
-    
+    updated_at = db.Column(db.DateTime, server_default=db.func.now())
+
     # Relationship
     case = db.relationship('CourtCase', backref=db.backref('updates', lazy=True))
     
@@ -82,11 +82,11 @@ class CaseUpdate(db.Model):
 def init_db(app):
     """Initialize database with Flask app"""
     db.init_app(app)
-    
+
     with app.app_context():
         # Create all tables
         db.create_all()
-        
+
         # Create indexes for better performance
         db.session.execute(db.text('CREATE INDEX IF NOT EXISTS idx_case_number ON court_cases(case_number)'))
         db.session.execute(db.text('CREATE INDEX IF NOT EXISTS idx_petitioner ON court_cases(petitioner)'))
@@ -96,6 +96,64 @@ def init_db(app):
         db.session.execute(db.text('CREATE INDEX IF NOT EXISTS idx_created_at ON court_cases(created_at)'))
         db.session.commit()
 
+        create_search_index()
+
+def create_search_index():
+    """Create the FTS5 full-text index over court cases
+
+    Builds an external-content FTS5 table mirroring case_number,
+    petitioner and respondent, plus triggers that keep it in sync with
+    court_cases on insert, update and delete. Must run inside an app
+    context after the tables exist.
+    """
+    db.session.execute(db.text(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS cases_fts USING fts5("
+        "case_number, petitioner, respondent, "
+        "content='court_cases', content_rowid='id')"
+    ))
+    db.session.execute(db.text(
+        "CREATE TRIGGER IF NOT EXISTS court_cases_fts_ai AFTER INSERT ON court_cases BEGIN "
+        "INSERT INTO cases_fts(rowid, case_number, petitioner, respondent) "
+        "VALUES (new.id, new.case_number, new.petitioner, new.respondent); "
+        "END"
+    ))
+    db.session.execute(db.text(
+        "CREATE TRIGGER IF NOT EXISTS court_cases_fts_ad AFTER DELETE ON court_cases BEGIN "
+        "INSERT INTO cases_fts(cases_fts, rowid, case_number, petitioner, respondent) "
+        "VALUES ('delete', old.id, old.case_number, old.petitioner, old.respondent); "
+        "END"
+    ))
+    db.session.execute(db.text(
+        "CREATE TRIGGER IF NOT EXISTS court_cases_fts_au AFTER UPDATE ON court_cases BEGIN "
+        "INSERT INTO cases_fts(cases_fts, rowid, case_number, petitioner, respondent) "
+        "VALUES ('delete', old.id, old.case_number, old.petitioner, old.respondent); "
+        "INSERT INTO cases_fts(rowid, case_number, petitioner, respondent) "
+        "VALUES (new.id, new.case_number, new.petitioner, new.respondent); "
+        "END"
+    ))
+    db.session.commit()
+
+def search_cases_fulltext(search_terms: str, limit: int = 10):
+    """Search cases through the FTS5 index instead of LIKE scans"""
+    # Quote each token so case numbers like W.P.(C) 1234/2023 are not
+    # misread as FTS5 query syntax
+    match_query = ' '.join(
+        '"{}"'.format(token.replace('"', '""'))
+        for token in search_terms.split()
+    )
+    if not match_query:
+        return []
+
+    rows = db.session.execute(
+        db.text('SELECT rowid FROM cases_fts WHERE cases_fts MATCH :q LIMIT :limit'),
+        {'q': match_query, 'limit': limit}
+    ).fetchall()
+    case_ids = [row[0] for row in rows]
+    if not case_ids:
+        return []
+
+    return CourtCase.query.filter(CourtCase.id.in_(case_ids)).all()
+
 def log_search(search_type: str, search_query: str, results_count: int, 
                ip_address: str = None, user_agent: str = None):
     """Log a search query"""
@@ -118,16 +176,18 @@ def get_case_by_number(case_number: str):
     return CourtCase.query.filter_by(case_number=case_number).first()
 
 def search_cases_by_party(party_name: str, limit: int = 10):
-    """Search cases by party name"""
+    """Search cases by party name prefix (use search_cases_fulltext for
+    substring matches)"""
     return CourtCase.query.filter(
-        (CourtCase.petitioner.ilike(f'%{party_name}%')) |
-        (CourtCase.respondent.ilike(f'%{party_name}%'))
+        (CourtCase.petitioner.like(f'{party_name}%')) |
+        (CourtCase.respondent.like(f'{party_name}%'))
     ).limit(limit).all()
 
 def search_cases_by_number(case_number: str, limit: int = 10):
-    """Search cases by case number"""
+    """Search cases by case number prefix (use search_cases_fulltext for
+    substring matches)"""
     return CourtCase.query.filter(
-        CourtCase.case_number.ilike(f'%{case_number}%')
+        CourtCase.case_number.like(f'{case_number}%')
     ).limit(limit).all()
 
 def add_case(case_data: dict):
@@ -141,12 +201,8 @@ def add_case(case_data: dict):
         db.session.rollback()
         print(f"Error adding case: {e}")
         return None
-    finally:
-        # Ensure session is properly closed in case of errors
-        if db.session.is_active:
-            db.session.close()
 
-def update_case(case_id: str, update_data: dict):
+def update_case(case_id: int, update_data: dict):
     """Update an existing case"""
     try:
         case = CourtCase.query.get(case_id)
@@ -195,15 +251,17 @@ def get_cases_by_date_range(start_date, end_date, limit: int = 10):
 def get_search_statistics():
     """Get search statistics"""
     total_cases = CourtCase.query.count()
-    total_searches = SearchLog.query.count()
-    
-    # Get search counts by type
-    case_number_searches = SearchLog.query.filter_by(search_type='case_number').count()
-    party_name_searches = SearchLog.query.filter_by(search_type='party_name').count()
-    
+
+    # One grouped scan of search_logs instead of three filtered counts
+    search_counts = dict(
+        db.session.query(SearchLog.search_type, db.func.count())
+        .group_by(SearchLog.search_type)
+        .all()
+    )
+
     return {
         'total_cases': total_cases,
-        'total_searches': total_searches,
-        'case_number_searches': case_number_searches,
-        'party_name_searches': party_name_searches
+        'total_searches': sum(search_counts.values()),
+        'case_number_searches': search_counts.get('case_number', 0),
+        'party_name_searches': search_counts.get('party_name', 0)
     }
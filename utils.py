@@ -1,10 +1,106 @@
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Dict, Any
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns, compiled once at import time
+# Single alternation covering the common case number formats:
+# W.P.(C) 1234/2023, LPA 123/2023, C.M.(M) 123 of 2023, CRL.A. 123-2023
+# and the generic TYPE 123/2023 or TYPE 123-2023 shape
+_CASE_NUMBER_RE = re.compile(
+    r'^(?:'
+    r'[A-Z\.]+\([A-Z]+\)\s+\d+/\d{4}'
+    r'|[A-Z\.]+\s+\d+/\d{4}'
+    r'|[A-Z\.]+\([A-Z]+\)\s+\d+\s+of\s+\d{4}'
+    r'|[A-Z\.]+\s+\d+-\d{4}'
+    r'|[A-Z\.]+\s+\d+[/\-]\d{4}'
+    r')$',
+    re.IGNORECASE
+)
+_WS_RE = re.compile(r'\s+')
+
+_DATE_FORMATS = (
+    '%Y-%m-%d',
+    '%d/%m/%Y',
+    '%d-%m-%Y',
+    '%Y/%m/%d',
+    '%d/%m/%y',
+    '%d-%m-%y'
+)
+_PARSE_DATE_FORMATS = _DATE_FORMATS + (
+    '%d %B %Y',
+    '%B %d, %Y'
+)
+
+def _detect_date_format(date_string: str) -> Optional[str]:
+    """
+    Pick the strptime format from the string's shape
+
+    Looks at length and separator positions so the common, zero-padded
+    date shapes parse with a single strptime call instead of raising
+    ValueError through a trial loop.
+    """
+    length = len(date_string)
+
+    if length == 10:
+        if date_string[4] == '-':
+            return '%Y-%m-%d'
+        if date_string[4] == '/':
+            return '%Y/%m/%d'
+        if date_string[2] == '/':
+            return '%d/%m/%Y'
+        if date_string[2] == '-':
+            return '%d-%m-%Y'
+    elif length == 8:
+        if date_string[2] == '/':
+            return '%d/%m/%y'
+        if date_string[2] == '-':
+            return '%d-%m-%y'
+
+    return None
+_SPECIAL_RE = re.compile(r'[^\w\s\-\.\(\)\/]')
+_SANITIZE_RE = re.compile(r'[<>"\']')
+_LETTER_RE = re.compile(r'[a-zA-Z]')
+
+# Common case types, matched as a single alternation anchored at the
+# start; longest-first so e.g. C.M.(M) wins over C.M.
+_CASE_TYPES = [
+    'W.P.(C)', 'W.P.(CRL)', 'W.P.(MD)', 'W.P.(CIVIL)', 'W.P.(CRIMINAL)',
+    'C.M.(M)', 'C.M.(W)', 'C.M.(MAIN)', 'C.M.(APPL)', 'C.M.(NO.)',
+    'LPA', 'FAO', 'RFA', 'CRL.A.', 'CRL.M.C.', 'CRL.REV.P.',
+    'C.R.P.', 'C.M.', 'O.A.', 'T.A.', 'A.A.', 'E.P.'
+]
+_CASE_TYPE_RE = re.compile(
+    '^(' + '|'.join(re.escape(case_type)
+                    for case_type in sorted(_CASE_TYPES, key=len, reverse=True)) + ')',
+    re.IGNORECASE
+)
+
+# Status keyword tables, keyed by lowercase token for one-hash lookups
+_STATUS_LABELS = {
+    'pending': 'Pending',
+    'disposed': 'Disposed',
+    'dismissed': 'Dismissed',
+    'closed': 'Closed',
+    'active': 'Active',
+    'inactive': 'Inactive',
+    'withdrawn': 'Withdrawn',
+    'settled': 'Settled'
+}
+_STATUS_COLORS = {
+    'pending': 'status-pending',
+    'active': 'status-pending',
+    'ongoing': 'status-pending',
+    'disposed': 'status-disposed',
+    'closed': 'status-disposed',
+    'settled': 'status-disposed',
+    'dismissed': 'status-dismissed',
+    'withdrawn': 'status-dismissed'
+}
+
 def validate_case_number(case_number: str) -> bool:
     """
     Validate case number format
@@ -17,26 +113,12 @@ def validate_case_number(case_number: str) -> bool:
     """
     if not case_number or not isinstance(case_number, str):
         return False
-    
-    # Common case number patterns
-    patterns = [
-        # W.P.(C) 1234/2023
-        r'^[A-Z\.]+\([A-Z]+\)\s+\d+/\d{4}$',
-        # LPA 123/2023
-        r'^[A-Z\.]+\s+\d+/\d{4}$',
-        # C.M.(M) 123 of 2023
-        r'^[A-Z\.]+\([A-Z]+\)\s+\d+\s+of\s+\d{4}$',
-        # CRL.A. 123-2023
-        r'^[A-Z\.]+\s+\d+-\d{4}$',
-        # Generic pattern
-        r'^[A-Z\.]+\s+\d+[/\-]\d{4}$'
-    ]
-    
-    for pattern in patterns:
-        if re.match(pattern, case_number, re.IGNORECASE):
-            return True
-    
-    return False
+
+    return _validate_case_number_cached(case_number)
+
+@lru_cache(maxsize=2048)
+def _validate_case_number_cached(case_number: str) -> bool:
+    return bool(_CASE_NUMBER_RE.match(case_number))
 
 def format_date(date_input: Any) -> Optional[str]:
     """
@@ -54,23 +136,24 @@ def format_date(date_input: Any) -> Optional[str]:
     try:
         # If it's already a string, try to parse it
         if isinstance(date_input, str):
-            # Try different date formats
-            date_formats = [
-                '%Y-%m-%d',
-                '%d/%m/%Y',
-                '%d-%m-%Y',
-                '%Y/%m/%d',
-                '%d/%m/%y',
-                '%d-%m-%y'
-            ]
-            
-            for fmt in date_formats:
+            date_string = date_input.strip()
+
+            # Dispatch on string shape so the common case is one strptime call
+            fmt = _detect_date_format(date_string)
+            if fmt:
+                try:
+                    return datetime.strptime(date_string, fmt).strftime('%d %B %Y')
+                except ValueError:
+                    pass
+
+            # Fall back to trying each format (e.g. non-zero-padded dates)
+            for fmt in _DATE_FORMATS:
                 try:
-                    parsed_date = datetime.strptime(date_input.strip(), fmt)
+                    parsed_date = datetime.strptime(date_string, fmt)
                     return parsed_date.strftime('%d %B %Y')
                 except ValueError:
                     continue
-            
+
             return date_input  # Return as is if can't parse
         
         # If it's a datetime or date object
@@ -97,24 +180,28 @@ def parse_date(date_string: str) -> Optional[datetime]:
         return None
     
     try:
-        # Try different date formats
-        date_formats = [
-            '%Y-%m-%d',
-            '%d/%m/%Y',
-            '%d-%m-%Y',
-            '%Y/%m/%d',
-            '%d/%m/%y',
-            '%d-%m-%y',
-            '%d %B %Y',
-            '%B %d, %Y'
-        ]
-        
-        for fmt in date_formats:
+        date_string = date_string.strip()
+
+        # Dispatch on string shape so the common case is one strptime call
+        fmt = _detect_date_format(date_string)
+        if fmt is None:
+            if ',' in date_string:
+                fmt = '%B %d, %Y'
+            elif ' ' in date_string:
+                fmt = '%d %B %Y'
+        if fmt:
+            try:
+                return datetime.strptime(date_string, fmt)
+            except ValueError:
+                pass
+
+        # Fall back to trying each format (e.g. non-zero-padded dates)
+        for fmt in _PARSE_DATE_FORMATS:
             try:
-                return datetime.strptime(date_string.strip(), fmt)
+                return datetime.strptime(date_string, fmt)
             except ValueError:
                 continue
-        
+
         return None
         
     except Exception as e:
@@ -135,13 +222,14 @@ def clean_text(text: str) -> str:
         return ""
     
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text.strip())
-    
+    text = _WS_RE.sub(' ', text.strip())
+
     # Remove special characters that might cause issues
-    text = re.sub(r'[^\w\s\-\.\(\)\/]', '', text)
-    
+    text = _SPECIAL_RE.sub('', text)
+
     return text
 
+@lru_cache(maxsize=2048)
 def extract_case_type(case_number: str) -> str:
     """
     Extract case type from case number
@@ -154,25 +242,17 @@ def extract_case_type(case_number: str) -> str:
     """
     if not case_number:
         return "Unknown"
-    
-    # Common case types
-    case_types = [
-        'W.P.(C)', 'W.P.(CRL)', 'W.P.(MD)', 'W.P.(CIVIL)', 'W.P.(CRIMINAL)',
-        'C.M.(M)', 'C.M.(W)', 'C.M.(MAIN)', 'C.M.(APPL)', 'C.M.(NO.)',
-        'LPA', 'FAO', 'RFA', 'CRL.A.', 'CRL.M.C.', 'CRL.REV.P.',
-        'C.R.P.', 'C.M.', 'O.A.', 'T.A.', 'A.A.', 'E.P.'
-    ]
-    
-    # Try to match exact case types
-    for case_type in case_types:
-        if case_number.upper().startswith(case_type.upper()):
-            return case_type
-    
+
+    # Try to match known case types in one regex pass
+    match = _CASE_TYPE_RE.match(case_number)
+    if match:
+        return match.group(1).upper()
+
     # Extract first part as case type
     parts = case_number.split()
     if parts:
         return parts[0]
-    
+
     return "Unknown"
 
 def normalize_case_number(case_number: str) -> str:
@@ -189,7 +269,7 @@ def normalize_case_number(case_number: str) -> str:
         return ""
     
     # Remove extra spaces and normalize
-    case_number = re.sub(r'\s+', ' ', case_number.strip())
+    case_number = _WS_RE.sub(' ', case_number.strip())
     
     # Convert to uppercase for consistency
     case_number = case_number.upper()
@@ -214,7 +294,7 @@ def validate_party_name(party_name: str) -> bool:
         return False
     
     # Should contain at least one letter
-    if not re.search(r'[a-zA-Z]', party_name):
+    if not _LETTER_RE.search(party_name):
         return False
     
     return True
@@ -233,13 +313,14 @@ def sanitize_input(input_string: str) -> str:
         return ""
     
     # Remove potentially dangerous characters
-    sanitized = re.sub(r'[<>"\']', '', input_string)
-    
+    sanitized = _SANITIZE_RE.sub('', input_string)
+
     # Remove extra whitespace
-    sanitized = re.sub(r'\s+', ' ', sanitized.strip())
+    sanitized = _WS_RE.sub(' ', sanitized.strip())
     
     return sanitized
 
+@lru_cache(maxsize=2048)
 def format_case_status(status: str) -> str:
     """
     Format case status for display
@@ -252,27 +333,24 @@ def format_case_status(status: str) -> str:
     """
     if not status:
         return "Unknown"
-    
-    # Common status mappings
-    status_mappings = {
-        'pending': 'Pending',
-        'disposed': 'Disposed',
-        'dismissed': 'Dismissed',
-        'closed': 'Closed',
-        'active': 'Active',
-        'inactive': 'Inactive',
-        'withdrawn': 'Withdrawn',
-        'settled': 'Settled'
-    }
-    
+
     status_lower = status.lower()
-    for key, value in status_mappings.items():
+
+    # One hash lookup per token for the common case
+    for token in status_lower.split():
+        label = _STATUS_LABELS.get(token)
+        if label:
+            return label
+
+    # Substring fallback for statuses like 'Disposed-Off'
+    for key, value in _STATUS_LABELS.items():
         if key in status_lower:
             return value
-    
+
     # Return title case if no mapping found
     return status.title()
 
+@lru_cache(maxsize=2048)
 def get_case_status_color(status: str) -> str:
     """
     Get CSS color class for case status
@@ -285,17 +363,21 @@ def get_case_status_color(status: str) -> str:
     """
     if not status:
         return "status-unknown"
-    
+
     status_lower = status.lower()
-    
-    if any(word in status_lower for word in ['pending', 'active', 'ongoing']):
-        return "status-pending"
-    elif any(word in status_lower for word in ['disposed', 'closed', 'settled']):
-        return "status-disposed"
-    elif any(word in status_lower for word in ['dismissed', 'withdrawn']):
-        return "status-dismissed"
-    else:
-        return "status-unknown"
+
+    # One hash lookup per token for the common case
+    for token in status_lower.split():
+        color = _STATUS_COLORS.get(token)
+        if color:
+            return color
+
+    # Substring fallback for statuses like 'Disposed-Off'
+    for key, color in _STATUS_COLORS.items():
+        if key in status_lower:
+            return color
+
+    return "status-unknown"
 
 def truncate_text(text: str, max_length: int = 100) -> str:
     """
@@ -325,13 +407,12 @@ def format_file_size(size_bytes: int) -> str:
     """
     if size_bytes == 0:
         return "0 B"
-    
+
     size_names = ["B", "KB", "MB", "GB", "TB"]
-    import math
-    i = int(math.floor(math.log(size_bytes, 1024)))
-    p = math.pow(1024, i)
-    s = round(size_bytes / p, 2)
-    
+    # bit_length gives the 1024-power exponent without any float math
+    i = min((size_bytes.bit_length() - 1) // 10, len(size_names) - 1)
+    s = round(size_bytes / (1 << (10 * i)), 2)
+
     return f"{s} {size_names[i]}"
 
 def generate_search_suggestions(query: str) -> list: